@@ -12,7 +12,8 @@ Features:
 """
 import pygame
 import random
-import time
+from collections import deque
+from itertools import islice
 
 # --- Constants ---
 SCREEN_WIDTH = 800
@@ -20,6 +21,7 @@ SCREEN_HEIGHT = 600
 GRID_SIZE = 20
 GRID_WIDTH = SCREEN_WIDTH // GRID_SIZE
 GRID_HEIGHT = SCREEN_HEIGHT // GRID_SIZE
+SHOW_GRID = False  # draw grid lines on the background
 
 # Colors
 BLACK = (0, 0, 0)
@@ -33,9 +35,40 @@ SNAKE_BODY_COLOR = (0, 225, 0)  # Lighter green for the body
 SNAKE_SPEED_NORMAL = 10
 SNAKE_SPEED_BOOST = 20
 
+# Directions are encoded as ints, paired so that opposites differ only
+# in the low bit: UP/DOWN and LEFT/RIGHT. DELTAS maps a direction to
+# its per-tick grid step.
+DIR_UP, DIR_DOWN, DIR_LEFT, DIR_RIGHT = 0, 1, 2, 3
+DELTAS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+# Arrow key scancode for each direction, indexed by direction int
+DIR_KEYS = (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT)
+
 # Power-up properties
 POWERUP_DURATION = 5  # seconds
 POWERUP_SPAWN_INTERVAL = 20  # seconds
+POWERUP_SPAWN_EVENT = pygame.USEREVENT + 1
+POWERUP_EXPIRE_EVENT = pygame.USEREVENT + 2
+
+# Pre-computed pixel rect for every grid cell, indexed as CELL_RECTS[x][y]
+CELL_RECTS = [[pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
+               for y in range(GRID_HEIGHT)]
+              for x in range(GRID_WIDTH)]
+
+# Every cell on the board as an integer key (x * GRID_HEIGHT + y); the
+# occupied and free sets use these keys because hashing a single int is
+# cheaper than hashing a coordinate tuple. Decode with divmod.
+ALL_CELLS = frozenset(x * GRID_HEIGHT + y
+                      for x in range(GRID_WIDTH) for y in range(GRID_HEIGHT))
+
+# Screen strip holding the score and high-score text
+SCORE_STRIP_RECT = pygame.Rect(0, 0, SCREEN_WIDTH, 50)
+
+# Pre-colored cell surfaces for batched snake blits and the static
+# background; created in initialize_game once the display exists so
+# they can be converted.
+HEAD_SURF = None
+BODY_SURF = None
+BACKGROUND = None
 
 # --- Game Setup ---
 def initialize_game():
@@ -43,6 +76,17 @@ def initialize_game():
     pygame.init()
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Snake Game")
+    # Only these event types are ever handled; block everything else
+    # (mouse motion etc.) so it never enters the event queue.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN,
+                              POWERUP_SPAWN_EVENT, POWERUP_EXPIRE_EVENT])
+    global HEAD_SURF, BODY_SURF, BACKGROUND
+    HEAD_SURF = pygame.Surface((GRID_SIZE, GRID_SIZE)).convert()
+    HEAD_SURF.fill(SNAKE_HEAD_COLOR)
+    BODY_SURF = pygame.Surface((GRID_SIZE, GRID_SIZE)).convert()
+    BODY_SURF.fill(SNAKE_BODY_COLOR)
+    BACKGROUND = create_background()
     return screen
 
 def load_high_score():
@@ -60,91 +104,158 @@ def save_high_score(score):
 
 # --- Game Components ---
 def create_snake():
-    """Initializes the snake's position and body."""
-    return [(GRID_WIDTH // 2, GRID_HEIGHT // 2)]
-
-def create_food(snake_body):
-    """Creates a food item at a random position."""
-    while True:
-        food_pos = (random.randint(0, GRID_WIDTH - 1), random.randint(0, GRID_HEIGHT - 1))
-        if food_pos not in snake_body:
-            return food_pos
-
-def create_powerup(snake_body):
-    """Creates a power-up at a random position."""
-    while True:
-        powerup_pos = (random.randint(0, GRID_WIDTH - 1), random.randint(0, GRID_HEIGHT - 1))
-        if powerup_pos not in snake_body:
-            return powerup_pos
+    """Initializes the snake's body, its pixel rects, occupied cells, and free cells."""
+    start = (GRID_WIDTH // 2, GRID_HEIGHT // 2)
+    occupied = {start[0] * GRID_HEIGHT + start[1]}
+    return (deque([start]), deque([CELL_RECTS[start[0]][start[1]]]),
+            occupied, set(ALL_CELLS - occupied))
+
+def create_food(free_cells):
+    """Creates a food item on a random free cell.
+
+    Returns the grid position and its pixel rect, computed once here
+    so drawing never has to.
+    """
+    x, y = divmod(random.choice(tuple(free_cells)), GRID_HEIGHT)
+    return (x, y), CELL_RECTS[x][y]
+
+def create_powerup(free_cells):
+    """Creates a power-up on a random free cell.
+
+    Returns the grid position and its pixel rect, like create_food.
+    """
+    x, y = divmod(random.choice(tuple(free_cells)), GRID_HEIGHT)
+    return (x, y), CELL_RECTS[x][y]
+
+# --- Font & Text Caching ---
+_fonts = {}
+_static_text = {}
+_digit_surfs = None
+
+def get_font(size):
+    """Returns a cached font instance, creating it on first use."""
+    font = _fonts.get(size)
+    if font is None:
+        font = _fonts[size] = pygame.font.Font(None, size)
+    return font
+
+def render_static_text(text, size, color):
+    """Renders a static string through a cache, rasterizing it only once."""
+    key = (text, size, color)
+    surface = _static_text.get(key)
+    if surface is None:
+        surface = _static_text[key] = get_font(size).render(text, True, color)
+    return surface
+
+def get_digit_surfs():
+    """Returns the digits 0-9 pre-rendered in the score font."""
+    global _digit_surfs
+    if _digit_surfs is None:
+        font = get_font(36)
+        _digit_surfs = tuple(font.render(digit, True, WHITE) for digit in "0123456789")
+    return _digit_surfs
 
 # --- Drawing Functions ---
-def draw_grid(screen):
-    """Draws the grid on the screen."""
-    for x in range(0, SCREEN_WIDTH, GRID_SIZE):
-        pygame.draw.line(screen, WHITE, (x, 0), (x, SCREEN_HEIGHT))
-    for y in range(0, SCREEN_HEIGHT, GRID_SIZE):
-        pygame.draw.line(screen, WHITE, (0, y), (SCREEN_WIDTH, y))
-
-def draw_snake(screen, snake_body):
-    """Draws the snake on the screen with a distinct head."""
-    # Draw the head
-    if snake_body:
-        head = snake_body[0]
-        pygame.draw.rect(screen, SNAKE_HEAD_COLOR, (head[0] * GRID_SIZE, head[1] * GRID_SIZE, GRID_SIZE, GRID_SIZE))
-
-        # Draw the body
-        for segment in snake_body[1:]:
-            pygame.draw.rect(screen, SNAKE_BODY_COLOR, (segment[0] * GRID_SIZE, segment[1] * GRID_SIZE, GRID_SIZE, GRID_SIZE))
-
-def draw_food(screen, food_pos):
+def create_background():
+    """Pre-renders the static background, with grid lines if SHOW_GRID is set.
+
+    Rendering the grid once into a surface replaces the 71 draw.line
+    calls the old per-frame draw_grid needed.
+    """
+    background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    background.fill(BLACK)
+    if SHOW_GRID:
+        for x in range(0, SCREEN_WIDTH, GRID_SIZE):
+            pygame.draw.line(background, WHITE, (x, 0), (x, SCREEN_HEIGHT))
+        for y in range(0, SCREEN_HEIGHT, GRID_SIZE):
+            pygame.draw.line(background, WHITE, (0, y), (SCREEN_WIDTH, y))
+    return background
+
+def draw_snake(screen, snake_rects):
+    """Draws the snake with a distinct head, batching the body blits."""
+    if snake_rects:
+        # One blits call blits every body segment in C instead of one
+        # Python->C round trip per segment; the rects carry pixel
+        # positions computed once when the segment was added.
+        screen.blits([(BODY_SURF, rect)
+                      for rect in islice(snake_rects, 1, None)], doreturn=0)
+        screen.blit(HEAD_SURF, snake_rects[0])
+
+def draw_food(screen, food_rect):
     """Draws the food on the screen."""
-    pygame.draw.rect(screen, RED, (food_pos[0] * GRID_SIZE, food_pos[1] * GRID_SIZE, GRID_SIZE, GRID_SIZE))
+    # Surface.fill is SDL's specialized fast path for axis-aligned
+    # filled rects, cheaper than the generic draw.rect rasterizer.
+    screen.fill(RED, food_rect)
 
-def draw_powerup(screen, powerup_pos):
+def draw_powerup(screen, powerup_rect):
     """Draws the power-up on the screen."""
-    pygame.draw.rect(screen, BLUE, (powerup_pos[0] * GRID_SIZE, powerup_pos[1] * GRID_SIZE, GRID_SIZE, GRID_SIZE))
+    screen.fill(BLUE, powerup_rect)
 
 def draw_score(screen, score, high_score):
-    """Draws the score and high score on the screen."""
-    font = pygame.font.Font(None, 36)
-    score_text = font.render(f"Score: {score}", True, WHITE)
-    high_score_text = font.render(f"High Score: {high_score}", True, WHITE)
-    screen.blit(score_text, (10, 10))
-    screen.blit(high_score_text, (SCREEN_WIDTH - high_score_text.get_width() - 10, 10))
+    """Draws the score and high score from pre-rendered labels and digit glyphs.
+
+    Composing the numbers out of cached glyphs means no text is ever
+    rasterized after the first frame, whatever the score values are.
+    """
+    digits = get_digit_surfs()
+    score_label = render_static_text("Score: ", 36, WHITE)
+    high_score_label = render_static_text("High Score: ", 36, WHITE)
+
+    blits = [(score_label, (10, 10))]
+    x = 10 + score_label.get_width()
+    for char in str(score):
+        glyph = digits[ord(char) - 48]
+        blits.append((glyph, (x, 10)))
+        x += glyph.get_width()
+
+    high_score_glyphs = [digits[ord(char) - 48] for char in str(high_score)]
+    total_width = high_score_label.get_width() + sum(g.get_width() for g in high_score_glyphs)
+    x = SCREEN_WIDTH - total_width - 10
+    blits.append((high_score_label, (x, 10)))
+    x += high_score_label.get_width()
+    for glyph in high_score_glyphs:
+        blits.append((glyph, (x, 10)))
+        x += glyph.get_width()
+    screen.blits(blits, doreturn=0)
 
 # --- Game Logic ---
-def move_snake(snake_body, direction):
-    """Moves the snake in the given direction."""
+def move_snake(snake_body, snake_rects, occupied, free_cells, direction, food_pos):
+    """Moves the snake in the given direction, growing it onto food.
+
+    Pops the tail here (unless the snake eats food_pos this tick) so
+    the cell the tail is vacating never counts as a self-collision,
+    matching the classic rules. Returns the collision flag and the
+    popped tail rect (None when the snake grew), so the whole step is
+    a single call on the hot path.
+    """
     head_x, head_y = snake_body[0]
-    if direction == "UP":
-        head_y -= 1
-    elif direction == "DOWN":
-        head_y += 1
-    elif direction == "LEFT":
-        head_x -= 1
-    elif direction == "RIGHT":
-        head_x += 1
+    dx, dy = DELTAS[direction]
+    head_x += dx
+    head_y += dy
     new_head = (head_x, head_y)
-    snake_body.insert(0, new_head)
-    return snake_body
-
-def check_collision(snake_body):
-    """Checks for collisions with walls or self."""
-    head = snake_body[0]
-    if (head[0] < 0 or head[0] >= GRID_WIDTH or
-            head[1] < 0 or head[1] >= GRID_HEIGHT):
-        return True  # Wall collision
-    if head in snake_body[1:]:
-        return True  # Self collision
-    return False
+    new_key = head_x * GRID_HEIGHT + head_y
+    in_bounds = 0 <= head_x < GRID_WIDTH and 0 <= head_y < GRID_HEIGHT
+    tail_rect = None
+    if new_head != food_pos:
+        tail = snake_body.pop()
+        tail_rect = snake_rects.pop()
+        tail_key = tail[0] * GRID_HEIGHT + tail[1]
+        occupied.discard(tail_key)
+        free_cells.add(tail_key)
+    collision = not in_bounds or new_key in occupied
+    snake_body.appendleft(new_head)
+    if in_bounds:
+        snake_rects.appendleft(CELL_RECTS[head_x][head_y])
+        occupied.add(new_key)
+        free_cells.discard(new_key)
+    return collision, tail_rect
 
 def game_over_screen(screen, score, high_score):
     """Displays the game over screen and waits for user input."""
-    font = pygame.font.Font(None, 72)
-    game_over_text = font.render("Game Over", True, RED)
-    score_text = pygame.font.Font(None, 36).render(f"Your Score: {score}", True, WHITE)
-    high_score_text = pygame.font.Font(None, 36).render(f"High Score: {high_score}", True, WHITE)
-    restart_text = pygame.font.Font(None, 36).render("Press 'R' to Restart or 'Q' to Quit", True, WHITE)
+    game_over_text = render_static_text("Game Over", 72, RED)
+    score_text = get_font(36).render(f"Your Score: {score}", True, WHITE)
+    high_score_text = get_font(36).render(f"High Score: {high_score}", True, WHITE)
+    restart_text = render_static_text("Press 'R' to Restart or 'Q' to Quit", 36, WHITE)
 
     screen.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, SCREEN_HEIGHT // 4))
     screen.blit(score_text, (SCREEN_WIDTH // 2 - score_text.get_width() // 2, SCREEN_HEIGHT // 2))
@@ -153,7 +264,7 @@ def game_over_screen(screen, score, high_score):
     pygame.display.flip()
 
     while True:
-        for event in pygame.event.get():
+        for event in pygame.event.get([pygame.QUIT, pygame.KEYDOWN]):
             if event.type == pygame.QUIT:
                 return "QUIT"
             if event.type == pygame.KEYDOWN:
@@ -164,9 +275,8 @@ def game_over_screen(screen, score, high_score):
 
 def pause_screen(screen):
     """Displays the pause screen."""
-    font = pygame.font.Font(None, 72)
-    pause_text = font.render("Game Paused", True, WHITE)
-    resume_text = pygame.font.Font(None, 36).render("Press SPACEBAR to Resume", True, WHITE)
+    pause_text = render_static_text("Game Paused", 72, WHITE)
+    resume_text = render_static_text("Press SPACEBAR to Resume", 36, WHITE)
     screen.blit(pause_text, (SCREEN_WIDTH // 2 - pause_text.get_width() // 2, SCREEN_HEIGHT // 2 - 50))
     screen.blit(resume_text, (SCREEN_WIDTH // 2 - resume_text.get_width() // 2, SCREEN_HEIGHT // 2 + 20))
     pygame.display.flip()
@@ -177,71 +287,97 @@ def game_loop():
     screen = initialize_game()
     clock = pygame.time.Clock()
 
+    # The high score only changes when the player beats it, so read the
+    # file once and keep the value in memory across restarts.
+    high_score = load_high_score()
+
     while True:
-        high_score = load_high_score()
-        snake_body = create_snake()
-        food_pos = create_food(snake_body)
+        snake_body, snake_rects, occupied, free_cells = create_snake()
+        food_pos, food_rect = create_food(free_cells)
         powerup_pos = None
-        direction = "RIGHT"
+        powerup_rect = None
+        direction = DIR_RIGHT
         score = 0
         paused = False
         speed = SNAKE_SPEED_NORMAL
-        powerup_active = False
-        powerup_timer = 0
-        last_powerup_spawn = time.time()
+        # One-shot timers drive power-up spawning and expiry as events,
+        # so the loop never polls the clock. Cancel any timers left over
+        # from the previous round and drop events they already posted
+        # (e.g. a spawn that fired on the game-over screen) before
+        # arming the first spawn.
+        pygame.time.set_timer(POWERUP_SPAWN_EVENT, 0)
+        pygame.time.set_timer(POWERUP_EXPIRE_EVENT, 0)
+        pygame.event.clear((POWERUP_SPAWN_EVENT, POWERUP_EXPIRE_EVENT))
+        pygame.time.set_timer(POWERUP_SPAWN_EVENT, POWERUP_SPAWN_INTERVAL * 1000, loops=1)
 
         running = True
+        full_redraw = True  # first frame and frames after pause/game over
         while running:
-            for event in pygame.event.get():
+            dirty_rects = []
+            for event in pygame.event.get([pygame.QUIT, pygame.KEYDOWN,
+                                           POWERUP_SPAWN_EVENT, POWERUP_EXPIRE_EVENT]):
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     return
-                if event.type == pygame.KEYDOWN:
+                if event.type == POWERUP_SPAWN_EVENT:
+                    if not powerup_pos and free_cells:
+                        powerup_pos, powerup_rect = create_powerup(free_cells)
+                        dirty_rects.append(powerup_rect)
+                elif event.type == POWERUP_EXPIRE_EVENT:
+                    speed = SNAKE_SPEED_NORMAL
+                elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE:
                         paused = not paused
-                    elif not paused:
-                        if event.key == pygame.K_UP and direction != "DOWN":
-                            direction = "UP"
-                        elif event.key == pygame.K_DOWN and direction != "UP":
-                            direction = "DOWN"
-                        elif event.key == pygame.K_LEFT and direction != "RIGHT":
-                            direction = "LEFT"
-                        elif event.key == pygame.K_RIGHT and direction != "LEFT":
-                            direction = "RIGHT"
 
             if paused:
                 pause_screen(screen)
+                full_redraw = True
                 continue
 
+            # Direction comes from the keyboard state bitmap instead of
+            # KEYDOWN events: one C call per tick, at most one change
+            # committed, still rejecting 180-degree reversals via the
+            # low-bit pairing of opposites.
+            keys = pygame.key.get_pressed()
+            for candidate in (DIR_UP, DIR_DOWN, DIR_LEFT, DIR_RIGHT):
+                if keys[DIR_KEYS[candidate]] and candidate ^ 1 != direction:
+                    direction = candidate
+                    break
+
             # Move snake
-            snake_body = move_snake(snake_body, direction)
+            old_head = snake_body[0]
+            collision, tail_rect = move_snake(snake_body, snake_rects, occupied,
+                                              free_cells, direction, food_pos)
+            new_head = snake_body[0]
+            dirty_rects.append(CELL_RECTS[old_head[0]][old_head[1]])
+            if 0 <= new_head[0] < GRID_WIDTH and 0 <= new_head[1] < GRID_HEIGHT:
+                dirty_rects.append(CELL_RECTS[new_head[0]][new_head[1]])
 
             # Check for food collision
-            if snake_body[0] == food_pos:
+            if new_head == food_pos:
                 score += 1
-                food_pos = create_food(snake_body)
+                dirty_rects.append(SCORE_STRIP_RECT)
+                if free_cells:
+                    food_pos, food_rect = create_food(free_cells)
+                    dirty_rects.append(food_rect)
+                else:
+                    # The snake fills the board and there is nowhere
+                    # left to spawn food: the player has won. End the
+                    # round through the game-over flow.
+                    food_pos, food_rect = None, None
+                    collision = True
             else:
-                snake_body.pop()
+                dirty_rects.append(tail_rect)
 
             # Check for power-up collision
-            if powerup_pos and snake_body[0] == powerup_pos:
+            if powerup_pos and new_head == powerup_pos:
                 speed = SNAKE_SPEED_BOOST
-                powerup_active = True
-                powerup_timer = time.time()
                 powerup_pos = None
-
-            # Power-up timer
-            if powerup_active and time.time() - powerup_timer > POWERUP_DURATION:
-                speed = SNAKE_SPEED_NORMAL
-                powerup_active = False
-
-            # Spawn power-up
-            if time.time() - last_powerup_spawn > POWERUP_SPAWN_INTERVAL and not powerup_pos:
-                powerup_pos = create_powerup(snake_body)
-                last_powerup_spawn = time.time()
+                pygame.time.set_timer(POWERUP_EXPIRE_EVENT, POWERUP_DURATION * 1000, loops=1)
+                pygame.time.set_timer(POWERUP_SPAWN_EVENT, POWERUP_SPAWN_INTERVAL * 1000, loops=1)
 
             # Check for game over
-            if check_collision(snake_body):
+            if collision:
                 if score > high_score:
                     high_score = score
                     save_high_score(high_score)
@@ -251,16 +387,23 @@ def game_loop():
                     return
                 elif action == "RESTART":
                     running = False
+                full_redraw = True
 
             # Drawing
-            screen.fill(BLACK)
-            # draw_grid(screen) # Optional: uncomment to see the grid
-            draw_snake(screen, snake_body)
-            draw_food(screen, food_pos)
+            screen.blit(BACKGROUND, (0, 0))
+            draw_snake(screen, snake_rects)
+            if food_pos:
+                draw_food(screen, food_rect)
             if powerup_pos:
-                draw_powerup(screen, powerup_pos)
+                draw_powerup(screen, powerup_rect)
             draw_score(screen, score, high_score)
-            pygame.display.flip()
+            # Present only the cells that changed this tick; a full flip
+            # is needed only after restart, pause, or game over.
+            if full_redraw:
+                pygame.display.flip()
+                full_redraw = False
+            else:
+                pygame.display.update(dirty_rects)
 
             # Control game speed
             clock.tick(speed)